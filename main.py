@@ -4,11 +4,25 @@
 # and clips counties + state-level primary/secondary roads to that boundary.
 
 import os
+import shutil
+import threading
 import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from email.utils import formatdate
 from pathlib import Path
+from typing import Callable
 
 import requests
 import geopandas as gpd
+import pyogrio
+import shapely
+from pyproj import CRS
+
+try:
+    import pyarrow  # noqa: F401  (optional, enables Arrow reads + GeoParquet cache)
+    USE_ARROW = True
+except ImportError:
+    USE_ARROW = False
 
 # ---------------------------------
 # CONFIGURATION
@@ -21,11 +35,45 @@ LAYER_URLS = {
     "counties": f"{BASE_URL}/COUNTY/tl_2020_us_county.zip",
     # PRISECROADS handled per-state using STATEFP (01, 02, ..., 72)
 }
+# Seconds to wait on census.gov before giving up on a request
+HTTP_TIMEOUT = 30
+
+# Bytes per read when streaming ZIP downloads to disk
+DOWNLOAD_CHUNK_SIZE = 128 * 1024
+
+# Shapefile parts kept when unzipping TIGER downloads
+SHAPEFILE_EXTENSIONS = (".shp", ".shx", ".dbf", ".prj", ".cpg")
+
+# Declared layer geometry type -> geometry types kept after clipping
+POLYGONISH = {"Polygon", "MultiPolygon"}
+LINEISH = {"LineString", "MultiLineString"}
+POINTISH = {"Point", "MultiPoint"}
+GEOMETRY_FAMILIES = {
+    "Polygon": POLYGONISH,
+    "MultiPolygon": POLYGONISH,
+    "LineString": LINEISH,
+    "MultiLineString": LINEISH,
+    "Point": POINTISH,
+    "MultiPoint": POINTISH,
+}
+
+# Only the states columns the boundary logic actually uses
+STATE_COLUMNS = ["STATEFP", "NAME", "STUSPS"]
+
+# State name / postal code -> STATEFP, filled on first resolve_state_fips call
+_FIPS_MAP: dict[str, str] | None = None
+
+# Set GIS_DEBUG=1 to also write intermediate outputs (e.g. city_boundary.shp)
+DEBUG = bool(os.environ.get("GIS_DEBUG"))
+
 # Output folders
 PROJECT_FOLDER = "GIS_Project_Starter"
 DOWNLOAD_FOLDER = os.path.join(PROJECT_FOLDER, "downloads")
 CLIPPED_FOLDER = os.path.join(PROJECT_FOLDER, "clipped")
 
+# One pooled HTTP session so downloads reuse census.gov connections
+SESSION = requests.Session()
+
 # Ensures directories exist
 os.makedirs(DOWNLOAD_FOLDER, exist_ok=True)
 os.makedirs(CLIPPED_FOLDER, exist_ok=True)
@@ -36,38 +84,87 @@ os.makedirs(CLIPPED_FOLDER, exist_ok=True)
 # ---------------------------------
 
 def download_zip(name: str, url: str) -> str:
-    """Download a ZIP file to downloads/<name>.zip, unless it already exists."""
+    """
+    Download a ZIP file to downloads/<name>.zip, unless it already exists
+    and the server reports it unchanged.
+    """
     local_path = os.path.join(DOWNLOAD_FOLDER, f"{name}.zip")
 
     # Avoids redownloading
     if os.path.exists(local_path):
-        print(f"{name}: ZIP already exists, skipping download.")
-        return local_path
+        if not remote_zip_changed(url, local_path):
+            print(f"{name}: ZIP already exists and is up to date, skipping download.")
+            return local_path
+        print(f"{name}: remote ZIP has changed, downloading again.")
 
     print(f"Downloading {name} from {url} ...")
-    resp = requests.get(url, stream=True)
-    resp.raise_for_status() # stops program if request fails
-
-    with open(local_path, "wb") as f:
-        for chunk in resp.iter_content(chunk_size=8192):
-            if chunk:
-                f.write(chunk)
+    # Download to a side file so an interrupted transfer never replaces
+    # (or poses as) a complete cached ZIP
+    part_path = f"{local_path}.part"
+    with SESSION.get(url, stream=True, timeout=HTTP_TIMEOUT) as resp:
+        resp.raise_for_status() # stops program if request fails
+
+        # Copy the raw stream straight to disk in large blocks
+        resp.raw.decode_content = True
+        with open(part_path, "wb") as f:
+            shutil.copyfileobj(resp.raw, f, length=DOWNLOAD_CHUNK_SIZE)
+    os.replace(part_path, local_path)
 
     print(f"{name}: downloaded to {local_path}")
     return local_path
 
 
+def remote_zip_changed(url: str, local_path: str) -> bool:
+    """
+    Send a HEAD with If-Modified-Since (local file mtime) and return True
+    only if the server has a different file. Any failure keeps the local copy.
+    """
+    headers = {"If-Modified-Since": formatdate(os.path.getmtime(local_path), usegmt=True)}
+    try:
+        resp = SESSION.head(url, headers=headers, allow_redirects=True, timeout=HTTP_TIMEOUT)
+    except requests.RequestException:
+        return False  # e.g. offline, just reuse the cached ZIP
+
+    if resp.status_code != 200:  # 304 Not Modified, or HEAD unsupported
+        return False
+
+    try:
+        content_length = int(resp.headers["Content-Length"])
+    except (KeyError, ValueError):
+        return False  # missing or malformed header, nothing to compare
+    return content_length != os.path.getsize(local_path)
+
+
 def unzip_zip(name: str, zip_path: str) -> str:
-    """Unzip ZIP into downloads/<name>/ and return the first .shp path."""
+    """
+    Unzip the shapefile parts of ZIP into downloads/<name>/
+    and return the first .shp path.
+    """
     extract_folder = os.path.join(DOWNLOAD_FOLDER, name)
     os.makedirs(extract_folder, exist_ok=True)
 
     print(f"Unzipping {zip_path} to {extract_folder} ...")
+    zip_mtime = os.path.getmtime(zip_path)
+    shp_path = None
     with zipfile.ZipFile(zip_path, "r") as zf:
-        zf.extractall(extract_folder)
+        for info in zf.infolist():
+            # Skip metadata XML etc. that nothing downstream reads
+            if not info.filename.lower().endswith(SHAPEFILE_EXTENSIONS):
+                continue
+
+            # Leave parts from an earlier unzip of this same ZIP untouched
+            target = os.path.join(extract_folder, info.filename)
+            if not (
+                os.path.exists(target)
+                and os.path.getsize(target) == info.file_size
+                and os.path.getmtime(target) >= zip_mtime
+            ):
+                target = zf.extract(info, extract_folder)
+
+            if shp_path is None and target.lower().endswith(".shp"):
+                shp_path = target
     print(f"{name}: unzip complete.")
 
-    shp_path = find_shapefile(extract_folder)
     if not shp_path:
         raise FileNotFoundError(f"No .shp found in {extract_folder} for {name}")
 
@@ -75,13 +172,61 @@ def unzip_zip(name: str, zip_path: str) -> str:
     return shp_path
 
 
-def find_shapefile(folder: str) -> str | None:
-    """Return the first .shp file found in folder (recursive), or None."""
-    for root, _, files in os.walk(folder):
-        for f in files:
-            if f.lower().endswith(".shp"):
-                return os.path.join(root, f)
-    return None
+def fetch_layer(name: str, url: str) -> str:
+    """Download + unzip one TIGER layer and return its .shp path."""
+    zip_path = download_zip(name, url)
+    return unzip_zip(name, zip_path)
+
+
+def prisecroads_layer(state_fips: str) -> tuple[str, str]:
+    """Return the (name, url) pair for a state's PRISECROADS ZIP."""
+    name = f"prisecroads_{state_fips}"
+    url = f"{BASE_URL}/PRISECROADS/tl_2020_{state_fips}_prisecroads.zip"
+    return name, url
+
+
+def read_layer(
+    shp_path: str,
+    columns: list[str] | None = None,
+    log: Callable[[str], None] = print,
+) -> gpd.GeoDataFrame:
+    """
+    Read a whole shapefile, preferring a GeoParquet copy next to it.
+    The copy is written on first read (needs pyarrow) and reused until
+    the shapefile is newer than it. An unreadable copy is rebuilt.
+    """
+    parquet_path = str(Path(shp_path).with_suffix(".parquet"))
+
+    gdf = None
+    if (
+        USE_ARROW
+        and os.path.exists(parquet_path)
+        and os.path.getmtime(parquet_path) >= os.path.getmtime(shp_path)
+    ):
+        read_columns = None if columns is None else [*columns, "geometry"]
+        try:
+            gdf = gpd.read_parquet(parquet_path, columns=read_columns)
+        except Exception as e:
+            log(f"  {parquet_path}: cache unreadable ({e}), rereading shapefile")
+
+    if gdf is None:
+        gdf = pyogrio.read_dataframe(shp_path, use_arrow=USE_ARROW)
+        if USE_ARROW:
+            # Write beside the cache and swap in, so an interrupted write
+            # never leaves a truncated .parquet behind
+            tmp_path = f"{parquet_path}.tmp"
+            try:
+                gdf.to_parquet(tmp_path)
+                os.replace(tmp_path, parquet_path)
+            except (OSError, ValueError, TypeError, NotImplementedError) as e:
+                # The copy is only a cache; the shapefile read already worked
+                log(f"  {parquet_path}: could not write cache ({e}), continuing without it")
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+    if columns is not None:
+        gdf = gdf[[*columns, gdf.geometry.name]]
+    return gdf
 
 
 def resolve_state_fips(states_gdf: gpd.GeoDataFrame, user_input: str) -> str:
@@ -89,51 +234,50 @@ def resolve_state_fips(states_gdf: gpd.GeoDataFrame, user_input: str) -> str:
     Given states GeoDataFrame and a user input like 'Texas' or 'TX',
     return the STATEFP code as a zero-padded string (e.g., '48').
     """
-    text = user_input.strip()
-
-    # Try full name
-    mask_name = states_gdf["NAME"].str.lower() == text.lower()
-    subset = states_gdf[mask_name]
-    if not subset.empty:
-        return str(subset.iloc[0]["STATEFP"]).zfill(2)
-
-    # Try postal code
-    mask_code = states_gdf["STUSPS"].str.upper() == text.upper()
-    subset = states_gdf[mask_code]
-    if not subset.empty:
-        return str(subset.iloc[0]["STATEFP"]).zfill(2)
-
-    # If neither works
-    raise ValueError(
-        f"Could not resolve state '{user_input}'. "
-        "Use full name (e.g., Texas) or 2-letter code (e.g., TX)."
-    )
+    global _FIPS_MAP
+
+    # Build the name/postal -> STATEFP lookup once, keyed in lower case
+    if _FIPS_MAP is None:
+        _FIPS_MAP = {
+            **{str(n).lower(): str(f) for n, f in zip(states_gdf["NAME"], states_gdf["STATEFP"])},
+            **{str(c).lower(): str(f) for c, f in zip(states_gdf["STUSPS"], states_gdf["STATEFP"])},
+        }
+
+    try:
+        return _FIPS_MAP[user_input.strip().lower()].zfill(2)
+    except KeyError:
+        raise ValueError(
+            f"Could not resolve state '{user_input}'. "
+            "Use full name (e.g., Texas) or 2-letter code (e.g., TX)."
+        ) from None
 
 
 def build_boundary(
     boundary_type: str,
     boundary_value: str,
-    states_shp: str,
-    counties_shp: str,
+    states_gdf: gpd.GeoDataFrame,
+    counties_gdf: gpd.GeoDataFrame | None = None,
 ) -> gpd.GeoDataFrame:
     """
     Build a boundary GeoDataFrame for:
       - state: state name or postal (Texas, TX)
       - fips:  5-digit county FIPS (e.g., 48113)
+    states_gdf is looked up by STATEFP and counties_gdf by GEOID (indexed
+    on those here if the caller hasn't); counties_gdf is only needed for 'fips'.
     """
     boundary_type = boundary_type.lower().strip()
     boundary_value = boundary_value.strip()
 
     if boundary_type == "state":
-        states = gpd.read_file(states_shp)
-        state_fips = resolve_state_fips(states, boundary_value)
+        state_fips = resolve_state_fips(states_gdf, boundary_value)
         # Select and dissolve state boundary
-        boundary = states[states["STATEFP"] == state_fips]
+        if states_gdf.index.name != "STATEFP":
+            states_gdf = states_gdf.set_index("STATEFP", drop=False)
 
-        if boundary.empty:
+        if state_fips not in states_gdf.index:
             raise ValueError(f"No state found for '{boundary_value}'.")
 
-        boundary = boundary.dissolve().reset_index(drop=True)
+        boundary = states_gdf.loc[[state_fips]].dissolve().reset_index(drop=True)
         print(f"Boundary: state '{boundary_value}' (STATEFP={state_fips}), features: {len(boundary)}")
         return boundary
 
@@ -142,16 +286,19 @@ def build_boundary(
         if len(boundary_value) != 5 or not boundary_value.isdigit():
             raise ValueError("County FIPS must be a 5-digit numeric code, e.g., 48113.")
 
-        counties = gpd.read_file(counties_shp)
-        subset = counties[counties["GEOID"] == boundary_value]
+        if counties_gdf is None:
+            raise ValueError("Counties data is required to build a FIPS boundary.")
 
-        if subset.empty:
+        if counties_gdf.index.name != "GEOID":
+            counties_gdf = counties_gdf.set_index("GEOID", drop=False)
+
+        if boundary_value not in counties_gdf.index:
             raise ValueError(
                 f"No county found with FIPS '{boundary_value}'. "
                 "Use the 5-digit GEOID value."
             )
 
-        boundary = subset.dissolve().reset_index(drop=True)
+        boundary = counties_gdf.loc[[boundary_value]].dissolve().reset_index(drop=True)
         print(f"Boundary: county GEOID={boundary_value}, features: {len(boundary)}")
         return boundary
 
@@ -162,38 +309,38 @@ def build_boundary(
 def build_city_boundary(
     city_name: str,
     state_input: str,
-    states_shp: str,
+    states_gdf: gpd.GeoDataFrame,
+    state_fips: str | None = None,
 ) -> gpd.GeoDataFrame:
     """
     Build a city/place boundary:
       - city_name: e.g., 'Dallas'
       - state_input: state name or code, e.g., 'Texas' or 'TX'
+      - state_fips: already-resolved STATEFP for state_input, if known
     """
-    states = gpd.read_file(states_shp)
-    state_fips = resolve_state_fips(states, state_input)
+    if state_fips is None:
+        state_fips = resolve_state_fips(states_gdf, state_input)
 
     # Construct PLACE URL for this state
     place_url = f"{BASE_URL}/PLACE/tl_2020_{state_fips}_place.zip"
     place_name = f"places_{state_fips}"
 
     # Download + unzip this state's PLACE file
-    zip_path = download_zip(place_name, place_url)
-    place_shp = unzip_zip(place_name, zip_path)
+    place_shp = fetch_layer(place_name, place_url)
 
-    places = gpd.read_file(place_shp)
+    places = read_layer(place_shp)
 
-    # Match city by state and name
-    mask_name = places["NAME"].str.lower() == city_name.strip().lower()
-    mask_state = places["STATEFP"] == state_fips
-    subset = places[mask_name & mask_state]
+    # The PLACE file is already per-state, so match on lower-case NAME only
+    places = places.set_index(places["NAME"].str.lower())
+    key = city_name.strip().lower()
 
-    if subset.empty:
+    if key not in places.index:
         raise ValueError(
             f"No place named '{city_name}' found in state '{state_input}' "
             f"(STATEFP={state_fips})."
         )
 
-    boundary = subset.dissolve().reset_index(drop=True)
+    boundary = places.loc[[key]].dissolve().reset_index(drop=True)
     print(
         f"Boundary: city '{city_name}' in state '{state_input}' "
         f"(STATEFP={state_fips}), features: {len(boundary)}"
@@ -201,52 +348,117 @@ def build_city_boundary(
     return boundary
 
 
+class BoundaryCache:
+    """
+    A boundary GeoDataFrame plus, per CRS, its reprojected copy and
+    unioned + prepared polygon, so several clips can share that work.
+    """
+
+    def __init__(self, boundary_gdf: gpd.GeoDataFrame):
+        self.boundary_gdf = boundary_gdf
+        self.crs = boundary_gdf.crs
+        self._by_crs: dict[CRS, tuple[gpd.GeoDataFrame, shapely.Geometry]] = {}
+        self._lock = threading.Lock()  # clips may run in parallel threads
+
+    def for_crs(self, crs) -> tuple[gpd.GeoDataFrame, shapely.Geometry]:
+        """Return (boundary in crs, unioned + prepared boundary polygon)."""
+        key = CRS.from_user_input(crs)
+        with self._lock:
+            if key not in self._by_crs:
+                if key == self.crs:
+                    boundary = self.boundary_gdf
+                else:
+                    boundary = self.boundary_gdf.to_crs(key)
+
+                bpoly = boundary.geometry.union_all()
+                shapely.prepare(bpoly)
+                self._by_crs[key] = (boundary, bpoly)
+            return self._by_crs[key]
+
+
+def bbox_covers_most_of_layer(bbox: tuple, layer_bounds, threshold: float = 0.5) -> bool:
+    """Return True if bbox overlaps more than threshold of the layer extent."""
+    if layer_bounds is None:
+        return False
+
+    lminx, lminy, lmaxx, lmaxy = layer_bounds
+    layer_area = (lmaxx - lminx) * (lmaxy - lminy)
+    if layer_area <= 0:
+        return False
+
+    minx, miny, maxx, maxy = bbox
+    overlap_w = max(0.0, min(maxx, lmaxx) - max(minx, lminx))
+    overlap_h = max(0.0, min(maxy, lmaxy) - max(miny, lminy))
+    return overlap_w * overlap_h / layer_area > threshold
+
+
 def clip_layer_to_boundary(
     layer_shp: str,
-    boundary_gdf: gpd.GeoDataFrame,
+    boundary: BoundaryCache,
     output_path: str,
+    log: Callable[[str], None] = print,
 ) -> None:
-    """Clip a TIGER layer to a polygon boundary, then enforce single geometry type."""
-    print(f"Clipping {layer_shp} ...")
-    base = gpd.read_file(layer_shp)
-    print(f"  {layer_shp}: {len(base)} features before clip")
+    """
+    Clip a TIGER layer to a polygon boundary, then enforce single geometry type.
+    Progress goes through log, so parallel callers can print it as one block.
+    """
+    log(f"Clipping {layer_shp} ...")
+    info = pyogrio.read_info(layer_shp)
+    layer_crs = info["crs"]
 
     # CRS must match or clip will be wrong
-    if base.crs is None or boundary_gdf.crs is None:
+    if layer_crs is None or boundary.crs is None:
         raise ValueError("CRS missing on base or boundary")
 
-    # Align CRS if needed
-    if base.crs != boundary_gdf.crs:
-        boundary = boundary_gdf.to_crs(base.crs)
+    # Let GDAL skip features outside the boundary extent while reading,
+    # unless the boundary covers most of the layer anyway
+    boundary_in_crs, bpoly = boundary.for_crs(layer_crs)
+    bbox = tuple(boundary_in_crs.total_bounds)
+    if bbox_covers_most_of_layer(bbox, info.get("total_bounds")):
+        base = read_layer(layer_shp, log=log)
     else:
-        boundary = boundary_gdf
-
-    # Actual clip
-    clipped = gpd.clip(base, boundary)
-    print(f"  {output_path}: {len(clipped)} features after clip (before geometry filter)")
-
-    # Decide what geometry family to keep based on base layer
-    geom_types = set(base.geom_type.unique())
-    polygonish = {"Polygon", "MultiPolygon"}
-    lineish = {"LineString", "MultiLineString"}
-    pointish = {"Point", "MultiPoint"}
-
-    if geom_types <= polygonish:
-        allowed = polygonish
-    elif geom_types <= lineish:
-        allowed = lineish
-    elif geom_types <= pointish:
-        allowed = pointish
+        base = pyogrio.read_dataframe(layer_shp, bbox=bbox, use_arrow=USE_ARROW)
+    log(f"  {layer_shp}: {len(base)} features before clip")
+
+    # Align CRS if needed (normally the same CRS, so a cache hit)
+    _, bpoly = boundary.for_crs(base.crs)
+
+    # Decide what geometry family to keep from the layer's declared type
+    # (e.g. "Polygon" or "LineString Z"), without touching every feature
+    declared = (info["geometry_type"] or "").split(" ")[0]
+
+    if declared == "Point":
+        # Single points can't be cut, so just keep those inside the boundary
+        xs = base.geometry.x.values
+        ys = base.geometry.y.values
+        clipped = base[shapely.intersects_xy(bpoly, xs, ys)]
+        log(f"  {output_path}: {len(clipped)} features inside boundary")
     else:
-        allowed = geom_types  # fallback
-
-    clipped = clipped[clipped.geometry.type.isin(allowed)].copy()
-    print(f"  {output_path}: {len(clipped)} features after filtering to {allowed}")
+        # Actual clip (gpd.clip prunes via the spatial index itself;
+        # the cached polygon is prepared, so its intersects tests are cheap)
+        clipped = gpd.clip(base, bpoly)
+        log(f"  {output_path}: {len(clipped)} features after clip (before geometry filter)")
+
+        allowed = GEOMETRY_FAMILIES.get(declared)
+        if allowed is None:
+            # Unknown declared type: pick the family from the observed types
+            geom_types = set(base.geom_type.unique())
+            if geom_types <= POLYGONISH:
+                allowed = POLYGONISH
+            elif geom_types <= LINEISH:
+                allowed = LINEISH
+            elif geom_types <= POINTISH:
+                allowed = POINTISH
+            else:
+                allowed = geom_types  # truly mixed layer
+
+        clipped = clipped[clipped.geometry.type.isin(allowed)]
+        log(f"  {output_path}: {len(clipped)} features after filtering to {allowed}")
 
     # Save output
     Path(os.path.dirname(output_path)).mkdir(parents=True, exist_ok=True)
-    clipped.to_file(output_path)
-    print(f"Saved clipped file: {output_path}")
+    pyogrio.write_dataframe(clipped, output_path, driver="ESRI Shapefile")
+    log(f"Saved clipped file: {output_path}")
 
 
 # ---------------------------------
@@ -277,63 +489,89 @@ def main() -> None:
     else:
         raise ValueError("Invalid choice. Use 'state', 'city', or 'fips' (or 1/2/3).")
 
-    # Step 1: Download + unzip national states, counties
-    states_zip = download_zip("states", LAYER_URLS["states"])
-    states_shp = unzip_zip("states", states_zip)
-
-    counties_zip = download_zip("counties", LAYER_URLS["counties"])
-    counties_shp = unzip_zip("counties", counties_zip)
-
-    # Step 2: determine STATEFP for roads (PRISECROADS)
-    states_gdf = gpd.read_file(states_shp)
-
-    if mode == "state":
-        state_fips = resolve_state_fips(states_gdf, state_input)
-    elif mode == "city":
-        state_fips = resolve_state_fips(states_gdf, city_state)
-    else:  # mode == "fips"
-        # First 2 digits of county GEOID = state FIPS
-        state_fips = fips_value[:2]
-
-    prisec_name = f"prisecroads_{state_fips}"
-    prisec_url = f"{BASE_URL}/PRISECROADS/tl_2020_{state_fips}_prisecroads.zip"
-    roads_zip = download_zip(prisec_name, prisec_url)
-    roads_shp = unzip_zip(prisec_name, roads_zip)
+    # Step 1 + 2: Download national states, counties and the state's
+    # PRISECROADS in parallel. Roads need STATEFP, which FIPS mode already
+    # knows; otherwise it is resolved from states as soon as they arrive.
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        states_future = pool.submit(fetch_layer, "states", LAYER_URLS["states"])
+        counties_future = pool.submit(fetch_layer, "counties", LAYER_URLS["counties"])
+
+        if mode == "fips":
+            # First 2 digits of county GEOID = state FIPS
+            state_fips = fips_value[:2]
+            roads_future = pool.submit(fetch_layer, *prisecroads_layer(state_fips))
+
+        # States are read once here and shared with the boundary builders
+        states_shp = states_future.result()
+        states_gdf = read_layer(states_shp, columns=STATE_COLUMNS)
+        states_gdf = states_gdf.set_index("STATEFP", drop=False)
+
+        if mode == "state":
+            state_fips = resolve_state_fips(states_gdf, state_input)
+            roads_future = pool.submit(fetch_layer, *prisecroads_layer(state_fips))
+        elif mode == "city":
+            state_fips = resolve_state_fips(states_gdf, city_state)
+            roads_future = pool.submit(fetch_layer, *prisecroads_layer(state_fips))
+
+        counties_shp = counties_future.result()
+        roads_shp = roads_future.result()
 
     # Step 3: Build boundary
     if mode == "city":
-        boundary = build_city_boundary(city_name, city_state, states_shp)
+        boundary = build_city_boundary(city_name, city_state, states_gdf, state_fips=state_fips)
         boundary_type = "city"
         boundary_value = city_name
-        boundary.to_file(os.path.join(CLIPPED_FOLDER, "city_boundary.shp"))
+        if DEBUG:
+            pyogrio.write_dataframe(
+                boundary, os.path.join(CLIPPED_FOLDER, "city_boundary.shp"), driver="ESRI Shapefile"
+            )
 
     elif mode == "state":
-        boundary = build_boundary("state", state_input, states_shp, counties_shp)
+        boundary = build_boundary("state", state_input, states_gdf)
         boundary_type = "state"
         boundary_value = state_input
     else:  # mode == "fips"
-        boundary = build_boundary("fips", fips_value, states_shp, counties_shp)
+        # Full counties table is only needed to look up a county GEOID
+        counties_gdf = read_layer(counties_shp)
+        counties_gdf = counties_gdf.set_index("GEOID", drop=False)
+        boundary = build_boundary("fips", fips_value, states_gdf, counties_gdf)
         boundary_type = "fips"
         boundary_value = fips_value
 
     # Optional: debug boundary
-    # boundary.to_file(os.path.join(CLIPPED_FOLDER, "boundary_debug.shp"))
+    # pyogrio.write_dataframe(boundary, os.path.join(CLIPPED_FOLDER, "boundary_debug.shp"), driver="ESRI Shapefile")
 
     print(f"\nUsing boundary type: {boundary_type}, value: {boundary_value}")
     print(f"Using state FIPS {state_fips} for PRISECROADS\n")
 
     # Step 4: Clip roads + counties
     print("Clipping layers to boundary...\n")
-
-    try:
-        clip_layer_to_boundary(roads_shp, boundary, os.path.join(CLIPPED_FOLDER, "roads_clipped.shp"))
-    except Exception as e:
-        print(f"Error clipping roads: {e}")
-
-    try:
-        clip_layer_to_boundary(counties_shp, boundary, os.path.join(CLIPPED_FOLDER, "counties_clipped.shp"))
-    except Exception as e:
-        print(f"Error clipping counties: {e}")
+    boundary_cache = BoundaryCache(boundary)
+
+    clip_jobs = {
+        "roads": (roads_shp, os.path.join(CLIPPED_FOLDER, "roads_clipped.shp")),
+        "counties": (counties_shp, os.path.join(CLIPPED_FOLDER, "counties_clipped.shp")),
+    }
+
+    # The clips are independent and GEOS releases the GIL, so run them together.
+    # Each worker logs into its own list, printed as one block when it finishes.
+    with ThreadPoolExecutor(max_workers=len(clip_jobs)) as pool:
+        futures = {}
+        for label, (layer_shp, output_path) in clip_jobs.items():
+            lines: list[str] = []
+            future = pool.submit(
+                clip_layer_to_boundary, layer_shp, boundary_cache, output_path, lines.append
+            )
+            futures[future] = (label, lines)
+
+        for future in as_completed(futures):
+            label, lines = futures[future]
+            for line in lines:
+                print(line)
+            try:
+                future.result()
+            except Exception as e:
+                print(f"Error clipping {label}: {e}")
 
     print("\nAll done.")
     print(f"Clipped outputs saved in: {os.path.abspath(CLIPPED_FOLDER)}")